@@ -25,7 +25,6 @@ CREATE TABLE IF NOT EXISTS public.company_scores (
 );
 
 -- Create indexes for company_scores
-CREATE INDEX IF NOT EXISTS idx_company_scores_company_id ON public.company_scores(company_id);
 CREATE INDEX IF NOT EXISTS idx_company_scores_overall ON public.company_scores(overall_score DESC);
 CREATE INDEX IF NOT EXISTS idx_company_scores_verification ON public.company_scores(verification_tier);
 CREATE INDEX IF NOT EXISTS idx_company_scores_growth ON public.company_scores(growth_rate DESC NULLS LAST);
@@ -74,7 +73,6 @@ CREATE TABLE IF NOT EXISTS public.votes (
 );
 
 -- Create indexes for votes
-CREATE INDEX IF NOT EXISTS idx_votes_user_id ON public.votes(user_id);
 CREATE INDEX IF NOT EXISTS idx_votes_company_id ON public.votes(company_id);
 CREATE INDEX IF NOT EXISTS idx_votes_type ON public.votes(vote_type);
 CREATE INDEX IF NOT EXISTS idx_votes_score ON public.votes(score DESC);
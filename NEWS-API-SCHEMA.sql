@@ -42,7 +42,6 @@ CREATE TABLE IF NOT EXISTS public.companies (
 );
 
 -- Create indexes for companies
-CREATE INDEX IF NOT EXISTS idx_companies_slug ON public.companies(slug);
 CREATE INDEX IF NOT EXISTS idx_companies_industry ON public.companies(industry);
 CREATE INDEX IF NOT EXISTS idx_companies_founded_year ON public.companies(founded_year);
 
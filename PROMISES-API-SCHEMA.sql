@@ -24,7 +24,6 @@ CREATE TABLE IF NOT EXISTS public.promise_votes (
 
 -- Create indexes for promise_votes
 CREATE INDEX IF NOT EXISTS idx_promise_votes_promise_id ON public.promise_votes(promise_id);
-CREATE INDEX IF NOT EXISTS idx_promise_votes_user_id ON public.promise_votes(user_id);
 CREATE INDEX IF NOT EXISTS idx_promise_votes_verdict ON public.promise_votes(verdict);
 CREATE INDEX IF NOT EXISTS idx_promise_votes_created ON public.promise_votes(created_at DESC);
 
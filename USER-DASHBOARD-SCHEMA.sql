@@ -15,8 +15,7 @@ ALTER TABLE public.profiles
   ADD COLUMN IF NOT EXISTS username TEXT UNIQUE,
   ADD COLUMN IF NOT EXISTS reputation INTEGER DEFAULT 0;
 
--- Create index for username lookups
-CREATE INDEX IF NOT EXISTS idx_profiles_username ON public.profiles(username);
+-- Create index for reputation ranking (username lookups use its UNIQUE index)
 CREATE INDEX IF NOT EXISTS idx_profiles_reputation ON public.profiles(reputation DESC);
 
 -- ============================================
@@ -33,7 +32,6 @@ CREATE TABLE IF NOT EXISTS public.user_follows (
 );
 
 -- Create indexes for user_follows
-CREATE INDEX IF NOT EXISTS idx_user_follows_user_id ON public.user_follows(user_id);
 CREATE INDEX IF NOT EXISTS idx_user_follows_company_id ON public.user_follows(company_id);
 CREATE INDEX IF NOT EXISTS idx_user_follows_created ON public.user_follows(created_at DESC);
 
@@ -121,7 +121,10 @@ const initializeDatabase = async () => {
     await client.query('CREATE INDEX IF NOT EXISTS idx_posts_created_at ON posts(created_at DESC)');
     await client.query('CREATE INDEX IF NOT EXISTS idx_comments_post_id ON comments(post_id)');
     await client.query('CREATE INDEX IF NOT EXISTS idx_votes_post_id ON votes(post_id)');
-    await client.query('CREATE INDEX IF NOT EXISTS idx_sessions_token ON sessions(token)');
+
+    // sessions.token is UNIQUE and already indexed; drop the duplicate
+    // index created by earlier deployments
+    await client.query('DROP INDEX IF EXISTS idx_sessions_token');
     
     console.log('✅ PostgreSQL Database tables created successfully');
     client.release();
@@ -1,4 +1,3 @@
-const { validationResult } = require('express-validator');
 const { pool } = require('../config/database');
 const newsAggregator = require('../services/newsAggregator');
 const fallbackMiddleware = require('../middleware/fallback');
@@ -1,6 +1,19 @@
+const https = require('https');
 const axios = require('axios');
 const { pool } = require('../config/database');
 
+// Shared keep-alive agent so repeated requests to the same API host reuse
+// TCP/TLS connections instead of handshaking per request
+const httpsAgent = new https.Agent({ keepAlive: true, maxSockets: 10 });
+
+// Map source categories to standardized categories
+const CATEGORY_MAP = Object.freeze({
+  tech: 'Tech News',
+  ai: 'AI',
+  gadgets: 'Gadgets',
+  software: 'Software'
+});
+
 class NewsAggregator {
   constructor() {
     this.apis = {
@@ -54,7 +67,8 @@ class NewsAggregator {
       const endpoint = this.apis.newsapi.endpoints[category] || this.apis.newsapi.endpoints.tech;
       const response = await axios.get(`${this.apis.newsapi.baseUrl}${endpoint}`, {
         headers: { 'X-API-Key': this.apis.newsapi.apiKey },
-        timeout: 10000
+        timeout: 10000,
+        httpsAgent
       });
 
       return response.data.articles.map(article => ({
@@ -82,7 +96,8 @@ class NewsAggregator {
 
       const endpoint = this.apis.guardian.endpoints[category] || this.apis.guardian.endpoints.tech;
       const response = await axios.get(`${this.apis.guardian.baseUrl}${endpoint}&api-key=${this.apis.guardian.apiKey}`, {
-        timeout: 10000
+        timeout: 10000,
+        httpsAgent
       });
 
       return response.data.response.results.map(article => ({
@@ -105,7 +120,8 @@ class NewsAggregator {
     try {
       const endpoint = this.apis.devto.endpoints[category] || this.apis.devto.endpoints.tech;
       const response = await axios.get(`${this.apis.devto.baseUrl}${endpoint}`, {
-        timeout: 10000
+        timeout: 10000,
+        httpsAgent
       });
 
       return response.data.map(article => ({
@@ -127,13 +143,14 @@ class NewsAggregator {
   async fetchFromHackerNews() {
     try {
       const response = await axios.get(`${this.apis.hackernews.baseUrl}/topstories.json`, {
-        timeout: 10000
+        timeout: 10000,
+        httpsAgent
       });
 
       const storyIds = response.data.slice(0, 20);
       const stories = await Promise.all(
         storyIds.map(id => 
-          axios.get(`${this.apis.hackernews.baseUrl}/item/${id}.json`, { timeout: 5000 })
+          axios.get(`${this.apis.hackernews.baseUrl}/item/${id}.json`, { timeout: 5000, httpsAgent })
             .then(res => res.data)
             .catch(() => null)
         )
@@ -158,13 +175,7 @@ class NewsAggregator {
 
   // Map category to standardized categories
   mapToCategory(category) {
-    const categoryMap = {
-      tech: 'Tech News',
-      ai: 'AI',
-      gadgets: 'Gadgets',
-      software: 'Software'
-    };
-    return categoryMap[category] || 'Tech News';
+    return CATEGORY_MAP[category] || 'Tech News';
   }
 
   // Fetch all articles from all sources
@@ -174,33 +185,42 @@ class NewsAggregator {
     const categories = ['tech', 'ai', 'gadgets', 'software'];
     const allArticles = [];
 
-    // Fetch from each source
-    for (const category of categories) {
-      try {
-        const [newsapiArticles, guardianArticles, devtoArticles] = await Promise.all([
-          this.fetchFromNewsAPI(category),
-          this.fetchFromGuardian(category),
-          this.fetchFromDevTo(category)
-        ]);
+    // Fetch from Hacker News (general tech news) while the categories load
+    const hackerNewsPromise = this.fetchFromHackerNews().catch(error => {
+      console.error('Error fetching Hacker News articles:', error.message);
+      return [];
+    });
 
-        allArticles.push(...newsapiArticles, ...guardianArticles, ...devtoArticles);
-      } catch (error) {
-        console.error(`Error fetching ${category} articles:`, error.message);
-      }
-    }
+    // Fetch every category from each source concurrently
+    const categoryResults = await Promise.all(
+      categories.map(async (category) => {
+        try {
+          const [newsapiArticles, guardianArticles, devtoArticles] = await Promise.all([
+            this.fetchFromNewsAPI(category),
+            this.fetchFromGuardian(category),
+            this.fetchFromDevTo(category)
+          ]);
 
-    // Fetch from Hacker News (general tech news)
-    try {
-      const hackerNewsArticles = await this.fetchFromHackerNews();
-      allArticles.push(...hackerNewsArticles);
-    } catch (error) {
-      console.error('Error fetching Hacker News articles:', error.message);
-    }
+          return [...newsapiArticles, ...guardianArticles, ...devtoArticles];
+        } catch (error) {
+          console.error(`Error fetching ${category} articles:`, error.message);
+          return [];
+        }
+      })
+    );
+
+    categoryResults.forEach(articles => allArticles.push(...articles));
+    allArticles.push(...await hackerNewsPromise);
 
     // Remove duplicates based on URL
-    const uniqueArticles = allArticles.filter((article, index, self) =>
-      index === self.findIndex(a => a.url === article.url)
-    );
+    const seenUrls = new Set();
+    const uniqueArticles = allArticles.filter(article => {
+      if (seenUrls.has(article.url)) {
+        return false;
+      }
+      seenUrls.add(article.url);
+      return true;
+    });
 
     console.log(`✅ Fetched ${uniqueArticles.length} unique articles`);
     return uniqueArticles;
@@ -208,45 +228,85 @@ class NewsAggregator {
 
   // Save articles to database
   async saveArticles(articles) {
-    try {
-      let savedCount = 0;
-      let skippedCount = 0;
+    const insertSql = `INSERT INTO articles (title, description, url, source, category, published_at, image_url)`;
+    const upsertSql = `ON DUPLICATE KEY UPDATE
+         title = VALUES(title),
+         description = VALUES(description),
+         updated_at = CURRENT_TIMESTAMP`;
 
-      for (const article of articles) {
-        try {
-          await pool.execute(
-            `INSERT INTO articles (title, description, url, source, category, published_at, image_url)
-             VALUES (?, ?, ?, ?, ?, ?, ?)
-             ON DUPLICATE KEY UPDATE
-             title = VALUES(title),
-             description = VALUES(description),
-             updated_at = CURRENT_TIMESTAMP`,
-            [
-              article.title,
-              article.description,
-              article.url,
-              article.source,
-              article.category,
-              article.published_at,
-              article.image_url
-            ]
-          );
-          savedCount++;
-        } catch (error) {
-          if (error.code === 'ER_DUP_ENTRY') {
+    const rows = articles.map(article => [
+      article.title,
+      article.description,
+      article.url,
+      article.source,
+      article.category,
+      article.published_at,
+      article.image_url
+    ]);
+
+    let savedCount = 0;
+    let skippedCount = 0;
+
+    if (rows.length > 0) {
+      const connection = await pool.getConnection();
+
+      try {
+        await connection.beginTransaction();
+
+        // Lock the URLs being written so a concurrent refresh cannot insert
+        // them between this check and the upsert. The unique url column uses
+        // a case-insensitive collation, so compare lowercased URLs.
+        const [existingRows] = await connection.query(
+          'SELECT url FROM articles WHERE url IN (?) FOR UPDATE',
+          [rows.map(row => row[2])]
+        );
+        const knownUrls = new Set(existingRows.map(row => row.url.toLowerCase()));
+
+        const countWritten = (row) => {
+          const url = row[2].toLowerCase();
+          if (knownUrls.has(url)) {
             skippedCount++;
           } else {
-            console.error('Error saving article:', error.message);
+            knownUrls.add(url);
+            savedCount++;
+          }
+        };
+
+        try {
+          // Write the whole batch with a single multi-row upsert
+          await connection.query(`${insertSql} VALUES ? ${upsertSql}`, [rows]);
+          rows.forEach(countWritten);
+        } catch (error) {
+          // A failed statement writes nothing and leaves the transaction
+          // open; retry row by row so one bad article does not discard the
+          // rest of the batch
+          console.error('Batch article save failed, retrying per article:', error.message);
+
+          for (const row of rows) {
+            try {
+              await connection.execute(
+                `${insertSql} VALUES (?, ?, ?, ?, ?, ?, ?) ${upsertSql}`,
+                row
+              );
+              countWritten(row);
+            } catch (rowError) {
+              console.error('Error saving article:', rowError.message);
+            }
           }
         }
-      }
 
-      console.log(`💾 Saved ${savedCount} new articles, skipped ${skippedCount} duplicates`);
-      return { saved: savedCount, skipped: skippedCount };
-    } catch (error) {
-      console.error('Error saving articles to database:', error.message);
-      throw error;
+        await connection.commit();
+      } catch (error) {
+        await connection.rollback();
+        console.error('Error saving articles to database:', error.message);
+        throw error;
+      } finally {
+        connection.release();
+      }
     }
+
+    console.log(`💾 Saved ${savedCount} new articles, skipped ${skippedCount} duplicates`);
+    return { saved: savedCount, skipped: skippedCount };
   }
 
   // Full aggregation process
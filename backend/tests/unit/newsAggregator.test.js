@@ -11,6 +11,9 @@ describe('News Aggregator', () => {
   });
 
   afterEach(async () => {
+    // Restore spied aggregator methods even if a test fails
+    jest.restoreAllMocks();
+
     // Clean up test data
     await pool.execute('DELETE FROM articles WHERE id > 0');
   });
@@ -146,6 +149,38 @@ describe('News Aggregator', () => {
     });
   });
 
+  describe('fetchAllArticles', () => {
+    it('should remove duplicate articles by URL', async () => {
+      const article = (url, source) => ({
+        title: `Article from ${source}`,
+        description: '',
+        url,
+        source,
+        category: 'Tech News',
+        published_at: new Date('2024-01-01'),
+        image_url: ''
+      });
+
+      jest.spyOn(newsAggregator, 'fetchFromNewsAPI').mockResolvedValue([]);
+      jest.spyOn(newsAggregator, 'fetchFromGuardian').mockResolvedValue([]);
+      jest.spyOn(newsAggregator, 'fetchFromDevTo').mockResolvedValue([
+        article('https://example.com/shared', 'Dev.to')
+      ]);
+      jest.spyOn(newsAggregator, 'fetchFromHackerNews').mockResolvedValue([
+        article('https://example.com/shared', 'Hacker News'),
+        article('https://example.com/unique', 'Hacker News')
+      ]);
+
+      const articles = await newsAggregator.fetchAllArticles();
+
+      expect(articles.map(a => a.url)).toEqual([
+        'https://example.com/shared',
+        'https://example.com/unique'
+      ]);
+      expect(articles[0].source).toBe('Dev.to');
+    });
+  });
+
   describe('saveArticles', () => {
     it('should save articles to database', async () => {
       const articles = [
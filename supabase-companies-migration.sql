@@ -197,20 +197,16 @@ CREATE TABLE user_badges (
 -- Create Indexes for Performance
 CREATE INDEX IF NOT EXISTS idx_companies_verification_status ON companies(verification_status);
 CREATE INDEX IF NOT EXISTS idx_companies_credibility_score ON companies(credibility_score DESC);
-CREATE INDEX IF NOT EXISTS idx_companies_slug ON companies(slug);
 CREATE INDEX IF NOT EXISTS idx_companies_industry ON companies(industry);
 CREATE INDEX IF NOT EXISTS idx_companies_created_at ON companies(created_at DESC);
 
 CREATE INDEX IF NOT EXISTS idx_reviews_company_id ON reviews(company_id);
-CREATE INDEX IF NOT EXISTS idx_reviews_user_id ON reviews(user_id);
 CREATE INDEX IF NOT EXISTS idx_reviews_status ON reviews(status);
 CREATE INDEX IF NOT EXISTS idx_reviews_created_at ON reviews(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_reviews_rating ON reviews(rating);
 
-CREATE INDEX IF NOT EXISTS idx_company_followers_company_id ON company_followers(company_id);
 CREATE INDEX IF NOT EXISTS idx_company_followers_user_id ON company_followers(user_id);
 
-CREATE INDEX IF NOT EXISTS idx_review_helpful_votes_review_id ON review_helpful_votes(review_id);
 CREATE INDEX IF NOT EXISTS idx_review_reports_review_id ON review_reports(review_id);
 
 CREATE INDEX IF NOT EXISTS idx_company_score_history_company_id ON company_score_history(company_id);
@@ -265,13 +265,11 @@ CREATE TABLE notifications (
 -- =====================================================
 
 -- Profiles indexes
-CREATE INDEX idx_profiles_username ON profiles(username);
 CREATE INDEX idx_profiles_user_type ON profiles(user_type);
 CREATE INDEX idx_profiles_level ON profiles(level DESC);
 CREATE INDEX idx_profiles_points ON profiles(points DESC);
 
 -- Companies indexes
-CREATE INDEX idx_companies_slug ON companies(slug);
 CREATE INDEX idx_companies_industry ON companies(industry);
 CREATE INDEX idx_companies_overall_score ON companies(overall_score DESC);
 CREATE INDEX idx_companies_trending_score ON companies(trending_score DESC);
@@ -283,21 +281,18 @@ CREATE INDEX idx_companies_tsv ON companies USING GIN(tsv);
 
 -- Reviews indexes
 CREATE INDEX idx_reviews_company_id ON reviews(company_id);
-CREATE INDEX idx_reviews_user_id ON reviews(user_id);
 CREATE INDEX idx_reviews_status ON reviews(status);
 CREATE INDEX idx_reviews_created_at ON reviews(created_at DESC);
 CREATE INDEX idx_reviews_overall_rating ON reviews(overall_rating);
 CREATE INDEX idx_reviews_helpful_count ON reviews(helpful_count DESC);
 
 -- News articles indexes
-CREATE INDEX idx_news_articles_slug ON news_articles(slug);
 CREATE INDEX idx_news_articles_published_at ON news_articles(published_at DESC);
 CREATE INDEX idx_news_articles_ethics_impact ON news_articles(ethics_impact);
 CREATE INDEX idx_news_articles_company_ids ON news_articles USING GIN(company_ids);
 CREATE INDEX idx_news_articles_tsv ON news_articles USING GIN(tsv);
 
 -- Discussions indexes
-CREATE INDEX idx_discussions_slug ON discussions(slug);
 CREATE INDEX idx_discussions_user_id ON discussions(user_id);
 CREATE INDEX idx_discussions_category ON discussions(category);
 CREATE INDEX idx_discussions_status ON discussions(status);
@@ -317,11 +312,9 @@ CREATE INDEX idx_score_history_company_id ON score_history(company_id);
 CREATE INDEX idx_score_history_recorded_at ON score_history(recorded_at DESC);
 
 -- User follows indexes
-CREATE INDEX idx_user_follows_user_id ON user_follows(user_id);
 CREATE INDEX idx_user_follows_company_id ON user_follows(company_id);
 
 -- Review votes indexes
-CREATE INDEX idx_review_votes_review_id ON review_votes(review_id);
 CREATE INDEX idx_review_votes_user_id ON review_votes(user_id);
 
 -- Discussion votes indexes
@@ -0,0 +1,8 @@
+-- ============================================
+-- DROP REDUNDANT INDEXES
+-- ============================================
+-- user_preferences.user_id is UNIQUE, so Postgres already maintains an
+-- index on it; the explicit index from 20250121_backend_functions.sql
+-- only adds write cost.
+
+DROP INDEX IF EXISTS idx_user_preferences_user_id;